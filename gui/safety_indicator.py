@@ -4,22 +4,38 @@ from PyQt5.QtGui import QColor, QPalette
 
 class SafetyLimitIndicator(QFrame):
     """Custom widget to show limit warning as a colored indicator"""
+
+    # Shared palettes, created on first use (requires a QApplication)
+    _PAL_OK = None
+    _PAL_WARN = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(20, 20)
         self.setFrameShape(QFrame.Box)
+        self.setAutoFillBackground(True)
         self.is_near_limit = False
         self.update_color()
-    
+
+    @classmethod
+    def _palettes(cls):
+        """Return the (ok, warning) palettes, building them once per class"""
+        if cls._PAL_OK is None:
+            palette = QPalette()
+            palette.setColor(QPalette.Background, QColor(0, 255, 0))  # Green
+            cls._PAL_OK = palette
+            palette = QPalette()
+            palette.setColor(QPalette.Background, QColor(255, 0, 0))  # Red
+            cls._PAL_WARN = palette
+        return cls._PAL_OK, cls._PAL_WARN
+
     def set_near_limit(self, is_near_limit):
+        is_near_limit = bool(is_near_limit)
+        if is_near_limit == self.is_near_limit:
+            return  # Unchanged state, skip the palette update and repaint
         self.is_near_limit = is_near_limit
         self.update_color()
-    
+
     def update_color(self):
-        palette = self.palette()
-        if self.is_near_limit:
-            palette.setColor(QPalette.Background, QColor(255, 0, 0))  # Red
-        else:
-            palette.setColor(QPalette.Background, QColor(0, 255, 0))  # Green
-        self.setAutoFillBackground(True)
-        self.setPalette(palette)
+        ok_palette, warn_palette = self._palettes()
+        self.setPalette(warn_palette if self.is_near_limit else ok_palette)
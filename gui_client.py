@@ -5,12 +5,9 @@ GUI Client Startup Script
 This script starts the PTZ control GUI client that connects to the API server
 using settings from the YAML configuration file.
 """
-import os
 import sys
 import logging
-from PyQt5.QtWidgets import QApplication
 
-from gui.main_window_api import MainWindowAPI
 from src.utils import load_config
 
 # Setup logging
@@ -20,11 +17,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Add parent directory to path to import gui package
-# This is necessary because the GUI package hasn't been refactored yet
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from gui.main_window_api import MainWindowAPI
-
 def main():
     """Main entry point"""
     # Load configuration
@@ -42,6 +34,12 @@ def main():
 
     logger.info(f"Connecting to PTZ API server at {server_url}")
 
+    # Qt is imported lazily so configuration failures exit without paying
+    # the PyQt5 import cost
+    from PyQt5.QtCore import Qt, QCoreApplication
+    from PyQt5.QtWidgets import QApplication
+    from gui.main_window_api import MainWindowAPI
+
     # Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("PTZ Control")
@@ -62,7 +60,6 @@ def main():
         app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         # Set custom scale factor if specified
-        from PyQt5.QtCore import Qt, QCoreApplication
         QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QCoreApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
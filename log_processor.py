@@ -15,10 +15,16 @@ Output:
 import sys
 import re
 import json
+import mmap
 import os
 import yaml
 from collections import Counter
 
+# Output buffering: lines are collected per logger and written in batches
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB file buffer
+OUTPUT_BATCH_LINES = 4096     # Lines accumulated before each write()
+INPUT_CHUNK_SIZE = 1 << 22    # 4 MiB slices used when counting input lines
+
 def load_config():
     """Load configuration from YAML file"""
     config_path = os.path.join('config', 'settings.yaml')
@@ -29,6 +35,60 @@ def load_config():
     with open(config_path, 'r') as f:
         return yaml.safe_load(f)
 
+def count_lines(data):
+    """Count lines in a bytes-like buffer, including a final unterminated line"""
+    total = 0
+    for offset in range(0, len(data), INPUT_CHUNK_SIZE):
+        total += data[offset:offset + INPUT_CHUNK_SIZE].count(b'\n')
+    if data and data[-1] != ord('\n'):
+        total += 1
+    return total
+
+def resolve_min_level(logger_name, pattern_matchers, level_hierarchy):
+    """Return the numeric minimum level for a logger from the first matching pattern"""
+    min_level = "INFO"  # Default
+    for pattern, pattern_level in pattern_matchers.items():
+        if pattern.match(logger_name):
+            min_level = pattern_level
+            break
+    return level_hierarchy.get(min_level, 0)
+
+def build_line_pattern(resolved_levels, level_hierarchy):
+    """
+    Build a log line pattern specialised to the target loggers and their levels.
+    
+    A lookahead only admits lines whose logger is one of the targets and
+    whose level passes that logger's minimum, so filtered lines are rejected
+    inside the regex engine and never reach the Python loop.
+    
+    Args:
+        resolved_levels: Dictionary mapping logger names to numeric minimum levels
+        level_hierarchy: Dictionary mapping level names to numeric levels
+        
+    Returns:
+        Compiled bytes pattern capturing timestamp, logger, level and message
+    """
+    alternatives = []
+    for logger, min_level_num in resolved_levels.items():
+        if min_level_num <= 0:
+            # Unknown levels rank as 0, so anything passes
+            levels = rb'[^\s-]+'
+        else:
+            levels = b'(?:' + b'|'.join(
+                re.escape(level.encode('ascii'))
+                for level, num in level_hierarchy.items() if num >= min_level_num
+            ) + b')'
+        alternatives.append(re.escape(logger.encode('utf-8')) + rb' +- +' + levels + rb' +- ')
+    admit = b'|'.join(alternatives) if alternatives else rb'(?!)'
+    
+    # Anchored per line (re.MULTILINE); surrounding whitespace is absorbed so
+    # the groups come back trimmed
+    return re.compile(
+        rb'^[^\S\n]*(\d+:\d+:\d+\.\d+) - +(?=' + admit + rb')'
+        rb'([^\s-]+) +- +([^\s-]+) +- (.+?)[^\S\n]*$',
+        re.MULTILINE
+    )
+
 def process_logs(input_file, loggers=None, level_rules=None, outputs=None):
     """
     Process logs according to the specified rules.
@@ -96,69 +156,70 @@ def process_logs(input_file, loggers=None, level_rules=None, outputs=None):
         else:
             pattern_matchers[re.compile(f"^{pattern}$")] = level
     
+    # Resolve the minimum level of every target logger once, up front
+    resolved_levels = {
+        logger: resolve_min_level(logger, pattern_matchers, level_hierarchy)
+        for logger in loggers
+    }
+    
     # Setup counters and stats
     stats = {
         "total_lines": 0,
         "processed_lines": 0,
-        "lines_per_logger": {logger: 0 for logger in loggers},
-        "top_warnings": Counter()
+        "lines_per_logger": Counter({logger: 0 for logger in loggers}),
     }
+    parser_msgs = []  # Parser warning messages, counted once after the loop
     
-    # Open output files
+    # Open output files (binary: matched lines are copied straight from the input)
     output_files = {}
+    output_buffers = {}
     for logger in loggers:
         output_path = outputs.get("<logger>.log", "").replace("<logger>", logger)
         if output_path:
-            output_files[logger] = open(f"{logger}.log", "w")
-    
-    # Parse log lines
-    log_pattern = re.compile(r'(\d+:\d+:\d+\.\d+) - ([^-]+) - ([^-]+) - (.+)')
-    
-    with open(input_file, 'r') as f:
-        for line in f:
-            stats["total_lines"] += 1
-            match = log_pattern.match(line.strip())
-            
-            if not match:
-                continue
+            output_files[logger] = open(f"{logger}.log", "wb", buffering=OUTPUT_BUFFER_SIZE)
+            output_buffers[logger] = []
+    
+    # Logger names as they appear in the raw input
+    targets = {logger.encode('utf-8'): logger for logger in resolved_levels}
+    
+    # Parse log lines with a pattern specialised to the resolved levels
+    log_pattern = build_line_pattern(resolved_levels, level_hierarchy)
+    
+    with open(input_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                stats["total_lines"] = count_lines(mm)
                 
-            timestamp, logger_name, level, message = match.groups()
-            logger_name = logger_name.strip()
-            level = level.strip()
-            
-            # Skip if not in our target loggers
-            if logger_name not in loggers:
-                continue
-            
-            # Determine minimum level for this logger
-            min_level = "INFO"  # Default
-            for pattern, pattern_level in pattern_matchers.items():
-                if pattern.match(logger_name):
-                    min_level = pattern_level
-                    break
-            
-            # Skip if below minimum level
-            if level_hierarchy.get(level, 0) < level_hierarchy.get(min_level, 0):
-                continue
-            
-            # Process the line
-            stats["processed_lines"] += 1
-            stats["lines_per_logger"][logger_name] = stats["lines_per_logger"].get(logger_name, 0) + 1
-            
-            # Store warning messages for parser
-            if logger_name == "run_all.server_thread.parser" and level == "WARNING":
-                stats["top_warnings"][message] += 1
-            
-            # Write to output file
-            if logger_name in output_files:
-                output_files[logger_name].write(line)
-    
-    # Close output files
-    for f in output_files.values():
+                for match in log_pattern.finditer(mm):
+                    timestamp, logger_name, level, message = match.groups()
+                    logger_name = targets[logger_name]
+                    
+                    # Process the line
+                    stats["processed_lines"] += 1
+                    stats["lines_per_logger"][logger_name] += 1
+                    
+                    # Store warning messages for parser
+                    if logger_name == "run_all.server_thread.parser" and level == b"WARNING":
+                        parser_msgs.append(message.decode('utf-8', 'replace'))
+                    
+                    # Buffer the full line (including its line ending) and
+                    # write it out in batches
+                    buf = output_buffers.get(logger_name)
+                    if buf is not None:
+                        buf.append(mm[match.start():match.end() + 1])
+                        if len(buf) >= OUTPUT_BATCH_LINES:
+                            output_files[logger_name].write(b''.join(buf))
+                            buf.clear()
+    
+    # Flush remaining buffered lines and close output files
+    for logger, f in output_files.items():
+        buf = output_buffers[logger]
+        if buf:
+            f.write(b''.join(buf))
         f.close()
     
     # Generate summary report
-    stats["top_warnings"] = dict(stats["top_warnings"].most_common(5))
+    stats["top_warnings"] = dict(Counter(parser_msgs).most_common(5))
     
     summary_path = outputs.get("summary.json", "")
     if summary_path:
@@ -18,6 +18,7 @@ Changes compared with the original:
 from __future__ import annotations
 
 import logging
+import os
 import signal
 import sys
 import threading
@@ -41,11 +42,59 @@ logging.basicConfig(
 )
 
 
-def _background_init(controller: PTZController) -> None:
+class _LazyController:
     """
-    Previously ran the zero-point initialization.
-    Now just logs that initialization is skipped as per requirements.
+    Stand-in for the PTZController while it is built in the background.
+
+    Attribute access blocks (up to INIT_WAIT seconds) until the real
+    controller exists, so the routes can be registered and the socket opened
+    before the serial port is touched.
     """
+
+    INIT_WAIT = 10.0
+
+    def __init__(self) -> None:
+        self._real: PTZController | None = None
+        self._error: Exception | None = None
+        self._ready = threading.Event()
+
+    def resolve(self, controller: PTZController | None, error: Exception | None = None) -> None:
+        """Hand over the real controller (or the error that prevented it)"""
+        self._real = controller
+        self._error = error
+        self._ready.set()
+
+    def __getattr__(self, name: str) -> Any:
+        if not self._ready.wait(self.INIT_WAIT):
+            raise RuntimeError("PTZ controller is still initialising")
+        if self._real is None:
+            raise RuntimeError("PTZ controller failed to initialise") from self._error
+        return getattr(self._real, name)
+
+    def close(self) -> None:
+        # Never block shutdown on a controller that was not built
+        if self._real is not None:
+            self._real.close()
+
+
+def _background_init(controller: _LazyController, conn_cfg: Dict[str, Any], address: int) -> None:
+    """
+    Build the PTZController (opening the connection) off the startup path.
+    Zero-point initialization is skipped as per requirements.
+    """
+    logger.info("[BG] Opening controller connection …")
+    try:
+        real = PTZController(connection_config=conn_cfg, address=address)
+    except Exception as exc:
+        logger.error("[BG] Controller initialisation failed: %s", exc)
+        controller.resolve(None, exc)
+        # Without a controller the API is useless; exit non-zero as the
+        # server did before the controller was built in the background.
+        # socketio.run() cannot be stopped from outside a request, so end
+        # the process directly once the logs are flushed.
+        logging.shutdown()
+        os._exit(1)
+    controller.resolve(real)
     logger.info("[BG] Controller zero-point initialization is disabled")
     # No initialization is performed - controller will run without offset correction
 
@@ -68,17 +117,24 @@ def main() -> int:
     port = api_cfg.get("port", 5000)
     debug = api_cfg.get("debug", False)
 
+    # The debug flag only raises log verbosity; the Werkzeug debugger and
+    # reloader are never enabled on the hardware-control server
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     # ------------------------------------------------------------------
     # 2. Build the API first so that a socket is open quickly ----------
     # ------------------------------------------------------------------
     app, socketio = create_app(api_cfg)
 
-    # Placeholder controller – will be replaced after init finishes
-    controller = PTZController(connection_config=conn_cfg, address=ctrl_cfg.get("address", 1))
+    # Placeholder controller – resolved once the background init finishes
+    controller = _LazyController()
     register_routes(app, socketio, controller)
 
-    # The heavy zero‑point routine is performed in the background
-    socketio.start_background_task(_background_init, controller)
+    # Opening the connection is performed in the background
+    socketio.start_background_task(
+        _background_init, controller, conn_cfg, ctrl_cfg.get("address", 1)
+    )
 
     # ------------------------------------------------------------------
     # 3. Graceful shutdown helpers -------------------------------------
@@ -103,8 +159,9 @@ def main() -> int:
             app,
             host=host,
             port=port,
-            debug=debug,
+            debug=False,
             use_reloader=False,  # Disable auto-reloading to prevent port conflicts
+            log_output=debug,  # Per-request access logs only in debug mode
             allow_unsafe_werkzeug=True,
         )
     finally:
@@ -5,16 +5,22 @@ Combined Startup Script
 This script starts both the PTZ control server and GUI client using
 configuration from the YAML file (no command-line arguments).
 """
+import copy
 import logging
+import logging.handlers
+import queue
 import threading
 import time
 import subprocess
 import sys
 import os
 import signal
+import select
+import socket
 import atexit
 import yaml
 import re
+import locale
 import pathlib
 
 # Load configuration from YAML
@@ -24,23 +30,55 @@ def load_config():
         print(f"Warning: Configuration file {config_path} not found. Using defaults.")
         return {}
     
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
+
+class _QueuedHandler(logging.handlers.QueueHandler):
+    """Enqueue records for the listener thread, tagged with the handler that writes them"""
+
+    def __init__(self, log_queue, target):
+        super().__init__(log_queue)
+        self.target = target
+
+    def prepare(self, record):
+        # Before Python 3.8 the base prepare() edits the record in place, so
+        # copy it first; otherwise a record enqueued for several handlers
+        # would keep only the last target tag
+        record = super().prepare(copy.copy(record))
+        record.target_handler = self.target
+        return record
+
+class _DispatchHandler(logging.Handler):
+    """Listener-side handler passing each record to the handler it was tagged with"""
+
+    def handle(self, record):
+        record.target_handler.handle(record)
+        return True
 
 # Setup logging based on YAML configuration
 def setup_logging(config):
     log_config = config.get('logging', {})
     
-    # Create base logger with default formatter
-    logging.basicConfig(
-        level=getattr(logging, log_config.get('root_level', 'INFO')),
-        format='%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    # Loggers only enqueue records; formatting and writes to the console and
+    # log files happen on a single listener thread
+    log_queue = queue.Queue()
+    
+    # One formatter shared by the console and every file handler
+    formatter = logging.Formatter('%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
+    
+    # Create base logger
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_config.get('root_level', 'INFO')))
+    root_logger.addHandler(_QueuedHandler(log_queue, console_handler))
     
     # Create log directory if needed
     log_dir = log_config.get('log_dir', 'logs')
-    if log_config.get('file_output', True) and not os.path.exists(log_dir):
+    file_output = log_config.get('file_output', True)
+    if file_output and not os.path.exists(log_dir):
         os.makedirs(log_dir, exist_ok=True)
     
     # Configure loggers based on config
@@ -53,25 +91,36 @@ def setup_logging(config):
         logger.setLevel(getattr(logging, level, logging.INFO))
         configured_loggers[logger_name] = logger
         
-        # Add file handler if enabled
-        if log_config.get('file_output', True):
-            file_handler = logging.FileHandler(os.path.join(log_dir, f"{logger_name}.log"))
-            file_handler.setFormatter(logging.Formatter('%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
-            logger.addHandler(file_handler)
+        # Add file handler if enabled; delay=True defers opening the file
+        # until the logger first emits
+        if file_output:
+            file_handler = logging.FileHandler(os.path.join(log_dir, f"{logger_name}.log"), delay=True)
+            file_handler.setFormatter(formatter)
+            logger.addHandler(_QueuedHandler(log_queue, file_handler))
     
-    # Compile pattern matchers for unconfigured loggers
-    pattern_rules = []
+    # Registered before the process cleanup hook, so it runs after it and
+    # drains that hook's records before exit
+    listener = logging.handlers.QueueListener(log_queue, _DispatchHandler())
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Compile pattern matchers for unconfigured loggers into one alternation;
+    # the index of the matching group picks the level (first pattern wins)
+    pattern_groups = []
+    pattern_levels = []
     for pattern, level in log_config.get('patterns', {'*': 'INFO'}).items():
         if '*' in pattern:
-            regex_pattern = pattern.replace('.', '\\.').replace('*', '.*')
-            pattern_rules.append((re.compile(f"^{regex_pattern}$"), getattr(logging, level, logging.INFO)))
+            regex_pattern = re.escape(pattern).replace('\\*', '.*')
+            pattern_groups.append(f"({regex_pattern})")
+            pattern_levels.append(getattr(logging, level, logging.INFO))
+    pattern_regex = re.compile(f"^(?:{'|'.join(pattern_groups)})$") if pattern_groups else None
     
     # Return all configuration
-    return configured_loggers, pattern_rules
+    return configured_loggers, (pattern_regex, pattern_levels)
 
 # Load configuration and setup logging
 config = load_config()
-configured_loggers, pattern_rules = setup_logging(config)
+configured_loggers, (pattern_regex, pattern_levels) = setup_logging(config)
 
 # Get or create loggers with appropriate levels
 def get_logger(name):
@@ -83,10 +132,9 @@ def get_logger(name):
     logger = logging.getLogger(name)
     
     # Apply pattern rules
-    for pattern, level in pattern_rules:
-        if pattern.match(name):
-            logger.setLevel(level)
-            break
+    match = pattern_regex.match(name) if pattern_regex else None
+    if match:
+        logger.setLevel(pattern_levels[match.lastindex - 1])
     
     # Store for future use
     configured_loggers[name] = logger
@@ -100,65 +148,160 @@ serial_rx_logger = get_logger('run_all.server_thread.serial_rx')
 zero_point_logger = get_logger('run_all.server_thread.zero_point')
 parser_logger = get_logger('run_all.server_thread.parser')
 client_logger = get_logger('run_all.client_thread')
+gui_api_logger = logging.getLogger('gui_client.api_client')
+
+# Child output is read as bytes and only decoded for lines that are logged;
+# this is the encoding text-mode pipes would have used
+_CHILD_ENCODING = locale.getpreferredencoding(False)
 
 # Global process references for clean shutdown
 server_process = None
 client_process = None
 
-def terminate_processes():
-    """Clean up function to terminate all processes"""
-    global server_process, client_process
-    
-    logger.info("Cleaning up processes...")
+# Platform-specific process handling, chosen once at import.
+# Windows cannot interrupt an untimed Event.wait() with Ctrl+C, so wait in
+# slices there; elsewhere block until a child exits
+if sys.platform == 'win32':
+    _WAIT_SLICE = 1.0
+    _NEW_SESSION = False
+
+    def _term(proc):
+        proc.terminate()
+
+    def _kill(proc):
+        proc.kill()  # TerminateProcess, no taskkill spawn
+else:
+    _WAIT_SLICE = None
+    # New process group, set up without preexec_fn, so the whole group
+    # can be signalled on shutdown
+    _NEW_SESSION = True
+
+    def _term(proc):
+        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+
+    def _kill(proc):
+        os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+
+# Child commands, resolved once at startup
+SERVER_CMD = (sys.executable, os.path.abspath('ptz_server.py'))
+CLIENT_CMD = (sys.executable, os.path.abspath('gui_client.py'))
+
+# How long the server gets to start accepting API connections
+SERVER_STARTUP_TIMEOUT = 15.0
+
+def wait_for_server(server_exited, timeout=SERVER_STARTUP_TIMEOUT):
+    """Wait until the server accepts API connections; False if it exits or times out
+
+    server_exited is set when the server thread returns, including when it
+    fails to launch the process at all.
+    """
+    api_config = config.get('api', {})
+    host = api_config.get('host', '127.0.0.1')
+    if host in ('', '0.0.0.0'):
+        host = '127.0.0.1'
+    port = api_config.get('port', 5000)
     
-    # Terminate client process
-    if client_process and client_process.poll() is None:
-        logger.info("Terminating client process...")
+    # Retry quickly at first, backing off while the server is still starting
+    delay = 0.005
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server_process is None:
+            # Server thread has not spawned the process yet, or failed to
+            if server_exited.wait(delay):
+                return False
+            delay = min(delay * 1.5, 0.25)
+            continue
+        # Short wait on the process doubles as the retry delay and catches
+        # a server that crashes during startup
+        try:
+            server_process.wait(timeout=delay)
+            return False
+        except subprocess.TimeoutExpired:
+            pass
         try:
-            if sys.platform == 'win32':
-                # Windows termination
-                client_process.terminate()
-            else:
-                # Unix termination
-                os.killpg(os.getpgid(client_process.pid), signal.SIGTERM)
-            client_process.wait(timeout=3)
-        except Exception as e:
-            logger.error(f"Error terminating client process: {e}")
-            # Force kill if termination failed
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            pass
+        delay = min(delay * 1.5, 0.25)
+    return False
+
+def _run_and_signal(func, event, *args):
+    """Run a child thread body and set event when it returns"""
+    try:
+        return func(*args)
+    finally:
+        event.set()
+
+def _wait_exit(proc, timeout):
+    """Wait for proc to exit, raising subprocess.TimeoutExpired after timeout"""
+    # On Linux a pidfd becomes readable the moment the process exits, so the
+    # wait blocks in the kernel instead of polling waitpid()
+    pidfd_open = getattr(os, 'pidfd_open', None)
+    if pidfd_open is not None:
+        try:
+            pidfd = pidfd_open(proc.pid)
+        except OSError:
+            pidfd = None  # Already reaped, or no kernel support
+        if pidfd is not None:
             try:
-                if client_process.poll() is None:
-                    if sys.platform == 'win32':
-                        subprocess.call(['taskkill', '/F', '/T', '/PID', str(client_process.pid)])
-                    else:
-                        os.killpg(os.getpgid(client_process.pid), signal.SIGKILL)
-            except Exception as e2:
-                logger.error(f"Error force killing client process: {e2}")
-    
-    # Wait briefly before terminating server to allow proper socket disconnection
-    time.sleep(0.5)
+                if not select.select([pidfd], [], [], timeout)[0]:
+                    raise subprocess.TimeoutExpired(proc.args, timeout)
+            finally:
+                os.close(pidfd)
+    # Reap (returns immediately once the process has exited)
+    return proc.wait(timeout=timeout)
+
+def _terminate(proc, name, grace=3.0):
+    """Terminate a child's process group, escalating to a kill after grace seconds"""
+    if proc is None or proc.poll() is not None:
+        return
     
-    # Terminate server process
-    if server_process and server_process.poll() is None:
-        logger.info("Terminating server process...")
+    logger.info("Terminating %s process...", name)
+    try:
+        _term(proc)
+        # Returns as soon as the child exits, up to the grace period
+        _wait_exit(proc, grace)
+    except Exception as e:
+        logger.error("Error terminating %s process: %s", name, e)
+        # Force kill if termination failed
         try:
-            if sys.platform == 'win32':
-                # Windows termination
-                server_process.terminate()
-            else:
-                # Unix termination
-                os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
-            server_process.wait(timeout=3)
-        except Exception as e:
-            logger.error(f"Error terminating server process: {e}")
-            # Force kill if termination failed
-            try:
-                if server_process.poll() is None:
-                    if sys.platform == 'win32':
-                        subprocess.call(['taskkill', '/F', '/T', '/PID', str(server_process.pid)])
-                    else:
-                        os.killpg(os.getpgid(server_process.pid), signal.SIGKILL)
-            except Exception as e2:
-                logger.error(f"Error force killing server process: {e2}")
+            if proc.poll() is None:
+                _kill(proc)
+        except Exception as e2:
+            logger.error("Error force killing %s process: %s", name, e2)
+
+def terminate_processes():
+    """Clean up function to terminate all processes"""
+    logger.info("Cleaning up processes...")
+    
+    # Client first; waiting for it to exit lets it disconnect from the server
+    _terminate(client_process, "client")
+    _terminate(server_process, "server")
+
+# Server output routing: one pass finds the first category marker in a line
+# (serial markers are case-sensitive, the rest are not)
+_SERVER_ROUTE_RE = re.compile(
+    rb'(?P<serial_tx>\[SERIAL TX\])|(?P<serial_rx>\[SERIAL RX\])'
+    rb'|(?P<zero_point>(?i:zero-point|zeroing))'
+    rb'|(?P<parser>(?i:checksum mismatch|invalid response))'
+)
+_SERVER_ROUTES = {
+    'serial_tx': (serial_tx_logger, logging.DEBUG),
+    'serial_rx': (serial_rx_logger, logging.DEBUG),
+    'zero_point': (zero_point_logger, logging.INFO),
+    'parser': (parser_logger, logging.WARNING),
+}
+
+def _server_output_wanted():
+    """True if any logger that server output is routed to would emit it"""
+    return server_logger.isEnabledFor(logging.INFO) or any(
+        target.isEnabledFor(level) for target, level in _SERVER_ROUTES.values()
+    )
+
+def _client_output_wanted():
+    """True if any logger that client output is routed to would emit it"""
+    return client_logger.isEnabledFor(logging.INFO) or gui_api_logger.isEnabledFor(logging.INFO)
 
 def process_server_output(line):
     """Process and route server output to appropriate loggers"""
@@ -166,54 +309,44 @@ def process_server_output(line):
     if not line:
         return
         
-    # Route based on content patterns
-    if "[SERIAL TX]" in line:
-        serial_tx_logger.debug(f"Server: {line}")
-    elif "[SERIAL RX]" in line:
-        serial_rx_logger.debug(f"Server: {line}")
-    elif "zero-point" in line.lower() or "zeroing" in line.lower():
-        zero_point_logger.info(f"Server: {line}")
-    elif "checksum mismatch" in line.lower() or "invalid response" in line.lower():
-        parser_logger.warning(f"Server: {line}")
-    else:
-        # Default server logger
-        server_logger.info(f"Server: {line}")
+    # Route based on content patterns; unmatched lines go to the default
+    # server logger
+    match = _SERVER_ROUTE_RE.search(line)
+    target, level = _SERVER_ROUTES[match.lastgroup] if match else (server_logger, logging.INFO)
+    if target.isEnabledFor(level):
+        target.log(level, "Server: %s", line.decode(_CHILD_ENCODING, 'replace'))
 
 def server_thread():
     """Function to run the server in a separate thread"""
     global server_process
-    cmd = [sys.executable, 'ptz_server.py']
-    
-    server_logger.info(f"Starting server with command: {' '.join(cmd)}")
+    server_logger.info("Starting server with command: %s %s", *SERVER_CMD)
     
     try:
-        # Create a new process group on Unix systems
-        kwargs = {}
-        if sys.platform != 'win32':
-            kwargs['preexec_fn'] = os.setsid
-        
+        # With every output logger filtered out, let the OS discard the
+        # child's output instead of piping it here to be dropped
+        output_wanted = _server_output_wanted()
         server_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,  # Line buffered output
-            **kwargs
+            SERVER_CMD,
+            stdout=subprocess.PIPE if output_wanted else subprocess.DEVNULL,
+            stderr=subprocess.STDOUT if output_wanted else subprocess.DEVNULL,
+            # Bytes pipe; lines are decoded only when they are logged
+            start_new_session=_NEW_SESSION
         )
         
         # Log server output with routing
-        for line in server_process.stdout:
-            process_server_output(line)
+        if output_wanted:
+            for line in server_process.stdout:
+                process_server_output(line)
                 
         # Check if process terminated with an error
         return_code = server_process.wait()
         if return_code != 0:
-            server_logger.error(f"Server process exited with code {return_code}")
+            server_logger.error("Server process exited with code %s", return_code)
             return False
         return True
         
     except Exception as e:
-        server_logger.error(f"Error running server: {e}")
+        server_logger.error("Error running server: %s", e)
         return False
 
 def client_thread(server_ready_event):
@@ -225,44 +358,40 @@ def client_thread(server_ready_event):
         client_logger.error("Timed out waiting for server to start")
         return False
     
-    cmd = [sys.executable, 'gui_client.py']
-    
-    client_logger.info(f"Starting client with command: {' '.join(cmd)}")
+    client_logger.info("Starting client with command: %s %s", *CLIENT_CMD)
     
     try:
-        # Create a new process group on Unix systems
-        kwargs = {}
-        if sys.platform != 'win32':
-            kwargs['preexec_fn'] = os.setsid
-        
+        output_wanted = _client_output_wanted()
         client_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,  # Line buffered output
-            **kwargs
+            CLIENT_CMD,
+            stdout=subprocess.PIPE if output_wanted else subprocess.DEVNULL,
+            stderr=subprocess.STDOUT if output_wanted else subprocess.DEVNULL,
+            # Bytes pipe; lines are decoded only when they are logged
+            start_new_session=_NEW_SESSION
         )
         
         # Log client output
-        for line in client_process.stdout:
-            line = line.strip()
-            if line:
-                # Check if line appears to be API client related
-                if "api_client" in line.lower() or "request" in line.lower() or "response" in line.lower():
-                    gui_api_logger = logging.getLogger('gui_client.api_client')
-                    gui_api_logger.info(f"Client: {line}")
-                else:
-                    client_logger.info(f"Client: {line}")
+        if output_wanted:
+            for line in client_process.stdout:
+                line = line.strip()
+                if line:
+                    # Check if line appears to be API client related
+                    lowered = line.lower()
+                    if b"api_client" in lowered or b"request" in lowered or b"response" in lowered:
+                        target = gui_api_logger
+                    else:
+                        target = client_logger
+                    if target.isEnabledFor(logging.INFO):
+                        target.info("Client: %s", line.decode(_CHILD_ENCODING, 'replace'))
         
         # Check if process terminated with an error
         return_code = client_process.wait()
         if return_code != 0:
-            client_logger.error(f"Client process exited with code {return_code}")
+            client_logger.error("Client process exited with code %s", return_code)
         return True
     
     except Exception as e:
-        client_logger.error(f"Error running client: {e}")
+        client_logger.error("Error running client: %s", e)
         return False
 
 def main():
@@ -270,51 +399,48 @@ def main():
     # Register cleanup handler
     atexit.register(terminate_processes)
     
-    # Add signal handlers
+    # Ctrl+C and SIGTERM both just raise KeyboardInterrupt, so cleanup runs
+    # on the main thread below instead of inside a signal handler
     for sig in [signal.SIGINT, signal.SIGTERM]:
-        signal.signal(sig, lambda s, f: (terminate_processes(), sys.exit(0)))
+        signal.signal(sig, signal.default_int_handler)
     
     logger.info("Starting Pan-Tilt Control System")
     
     # Event to signal when server is ready
     server_ready_event = threading.Event()
     
-    # Start server in a separate thread
-    server_thread_obj = threading.Thread(
-        target=lambda: server_thread() and server_ready_event.set(),
-        daemon=True
-    )
-    server_thread_obj.start()
-    
-    # Wait for server to initialize (at least partially)
-    time.sleep(2)
-    
-    # Check if server started successfully by checking if it's still running
-    if server_process is None or server_process.poll() is not None:
-        logger.error("Server failed to start")
-        terminate_processes()
-        return 1
-    
-    server_ready_event.set()  # Signal that client can start
+    # Set as soon as either child's thread finishes (its process exited)
+    child_exited = threading.Event()
     
-    # Start client in a separate thread
-    client_thread_obj = threading.Thread(
-        target=lambda: client_thread(server_ready_event),
-        daemon=True
-    )
-    client_thread_obj.start()
-    
-    # Wait for threads to complete
     try:
-        # Keep running until client exits or keyboard interrupt
-        while True:
-            if not client_thread_obj.is_alive() or (client_process and client_process.poll() is not None):
-                logger.info("Client thread exited, stopping application")
-                break
-            if not server_thread_obj.is_alive() or (server_process and server_process.poll() is not None):
-                logger.info("Server thread exited, stopping application")
-                break
-            time.sleep(1)
+        # Start server in a separate thread
+        server_thread_obj = threading.Thread(
+            target=lambda: _run_and_signal(server_thread, child_exited),
+            daemon=True
+        )
+        server_thread_obj.start()
+        
+        # Wait until the server is actually listening (or has died)
+        if not wait_for_server(child_exited):
+            logger.error("Server failed to start")
+            return 1
+        
+        server_ready_event.set()  # Signal that client can start
+        
+        # Start client in a separate thread
+        client_thread_obj = threading.Thread(
+            target=lambda: _run_and_signal(client_thread, child_exited, server_ready_event),
+            daemon=True
+        )
+        client_thread_obj.start()
+        
+        # Keep running until a child exits or keyboard interrupt
+        while not child_exited.wait(_WAIT_SLICE):
+            pass
+        if not client_thread_obj.is_alive() or (client_process and client_process.poll() is not None):
+            logger.info("Client thread exited, stopping application")
+        else:
+            logger.info("Server thread exited, stopping application")
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
     finally:
@@ -11,8 +11,10 @@ This script:
 """
 
 import time
+import struct
 import logging
 import argparse
+from itertools import islice
 from src.connection.simulator_connection import SimulatorConnection
 
 # Configure logging
@@ -20,20 +22,22 @@ logging.basicConfig(level=logging.INFO,
                    format="%(asctime)s %(levelname)-8s| %(message)s")
 logger = logging.getLogger("simple_demo")
 
+# Pelco D frame, and the big-endian position value in a 5-byte reply
+_FRAME = struct.Struct('7B')
+_U16 = struct.Struct('>H').unpack_from
+
 
 def calculate_checksum(message):
     """Calculate Pelco D checksum for a list of bytes"""
-    # Skip sync byte (first byte) in checksum calculation
-    checksum = sum(message[1:]) % 256
+    # Skip sync byte (first byte) in checksum calculation, without a slice copy
+    checksum = sum(islice(message, 1, None)) & 0xFF
     return checksum
 
 
 def create_command(address, cmd1, cmd2, data1, data2):
     """Create a Pelco D command"""
-    message = [0xFF, address, cmd1, cmd2, data1, data2]
-    checksum = calculate_checksum(message)
-    message.append(checksum)
-    return bytes(message)
+    message = (0xFF, address, cmd1, cmd2, data1, data2)
+    return _FRAME.pack(*message, calculate_checksum(message))
 
 
 def run_demo(address=1):
@@ -63,9 +67,7 @@ def run_demo(address=1):
         try:
             response = simulator.receive(timeout=1.0)
             if response and len(response) == 5 and response[1] == 0x59:
-                msb = response[2]
-                lsb = response[3]
-                raw_position = (msb << 8) | lsb
+                raw_position = _U16(response, 2)[0]
                 angle = raw_position / 100.0
                 logger.info(f"Pan position: {angle:.2f}°")
             else:
@@ -82,9 +84,7 @@ def run_demo(address=1):
         try:
             response = simulator.receive(timeout=1.0)
             if response and len(response) == 5 and response[1] == 0x5B:
-                msb = response[2]
-                lsb = response[3]
-                raw_position = (msb << 8) | lsb
+                raw_position = _U16(response, 2)[0]
                 
                 # Calculate angle according to protocol
                 if raw_position > 18000:
@@ -109,7 +109,6 @@ def run_demo(address=1):
         pan_data2 = pan_value & 0xFF
         command = create_command(address, 0x00, 0x4B, pan_data1, pan_data2)
         simulator.send(command)
-        time.sleep(0.2)
         
         # Tilt to 30 degrees
         tilt_angle = 30.0
@@ -118,9 +117,9 @@ def run_demo(address=1):
         tilt_data2 = tilt_value & 0xFF
         command = create_command(address, 0x00, 0x4D, tilt_data1, tilt_data2)
         simulator.send(command)
-        time.sleep(0.2)
         
-        # Query positions after movement
+        # Query positions after movement; the simulator handles frames in
+        # order, so the queries are answered after both moves are applied
         logger.info("Querying position after movement...")
         
         # Query pan position
@@ -129,9 +128,7 @@ def run_demo(address=1):
         try:
             response = simulator.receive(timeout=1.0)
             if response and len(response) == 5 and response[1] == 0x59:
-                msb = response[2]
-                lsb = response[3]
-                raw_position = (msb << 8) | lsb
+                raw_position = _U16(response, 2)[0]
                 angle = raw_position / 100.0
                 logger.info(f"Pan position after movement: {angle:.2f}°")
         except TimeoutError:
@@ -143,9 +140,7 @@ def run_demo(address=1):
         try:
             response = simulator.receive(timeout=1.0)
             if response and len(response) == 5 and response[1] == 0x5B:
-                msb = response[2]
-                lsb = response[3]
-                raw_position = (msb << 8) | lsb
+                raw_position = _U16(response, 2)[0]
                 if raw_position > 18000:
                     angle = (36000 - raw_position) / 100.0
                 else:
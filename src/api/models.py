@@ -1,10 +1,17 @@
 """
 Data models for API requests and responses.
 """
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
 
+# Valid movement directions
+_DIRECTIONS = frozenset(('up', 'down', 'left', 'right', 'stop'))
+
+# Largest step size (degrees) accepted by a step request
+MAX_STEP = 10.0
+
+
 @dataclass
 class MovementRequest:
     """Request model for movement controls"""
@@ -19,7 +26,7 @@ class MovementRequest:
         Returns:
             True if valid, False otherwise
         """
-        if self.direction not in ['up', 'down', 'left', 'right', 'stop']:
+        if self.direction not in _DIRECTIONS:
             return False
             
         if not 0 <= self.speed <= 0x3F:
@@ -68,10 +75,10 @@ class StepPositionRequest:
             return False
             
         # Step sizes must be within limits
-        if self.step_pan is not None and abs(self.step_pan) > 10.0:
+        if self.step_pan is not None and abs(self.step_pan) > MAX_STEP:
             return False
             
-        if self.step_tilt is not None and abs(self.step_tilt) > 10.0:
+        if self.step_tilt is not None and abs(self.step_tilt) > MAX_STEP:
             return False
             
         return True
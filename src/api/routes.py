@@ -70,6 +70,7 @@ def register_routes(app: Flask, socketio: SocketIO, controller: PTZController):
     def position_update_thread():
         """Thread that periodically emits position updates via WebSocket"""
         while True:
+            polling_rate = 0.5
             try:
                 # Use a try-except block to catch any errors in the position update
                 try:
@@ -123,11 +124,12 @@ def register_routes(app: Flask, socketio: SocketIO, controller: PTZController):
                             'error': str(e)
                         }
                     })
+                
+                # Use the configured polling rate from YAML
+                polling_rate = getattr(current_controller.connection, '_polling_rate', 0.5)
             except Exception as e:
                 logger.error(f"Error in position update thread: {e}")
             
-            # Use the configured polling rate from YAML
-            polling_rate = getattr(current_controller.connection, '_polling_rate', 0.5)
             time.sleep(polling_rate)
     
     # Start the position update thread
@@ -221,10 +223,7 @@ def register_routes(app: Flask, socketio: SocketIO, controller: PTZController):
                 # Get the current controller instance (handles reloads)
                 current_controller = getattr(socketio, 'controller', controller)
                 
-                if pos_request.pan is not None:
-                    current_controller.absolute_pan(pos_request.pan)
-                if pos_request.tilt is not None:
-                    current_controller.absolute_tilt(pos_request.tilt)
+                current_controller.absolute_pan_tilt(pos_request.pan, pos_request.tilt)
             
             # Queue the absolute movement
             queue_command(perform_abs_movement)
@@ -306,10 +305,7 @@ def register_routes(app: Flask, socketio: SocketIO, controller: PTZController):
                 # Get the current controller instance (handles reloads)
                 current_controller = getattr(socketio, 'controller', controller)
                 
-                if target_pan is not None:
-                    current_controller.absolute_pan(target_pan)
-                if target_tilt is not None:
-                    current_controller.absolute_tilt(target_tilt)
+                current_controller.absolute_pan_tilt(target_pan, target_tilt)
             
             # Queue the step movement
             queue_command(perform_step_movement)
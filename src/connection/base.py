@@ -148,6 +148,16 @@ class ConnectionBase(ABC):
         """
         pass
     
+    def discard_input(self) -> None:
+        """
+        Drop any received data that has not been read yet.
+        
+        Called before sending a query so a stale reply from an earlier,
+        timed-out request is not taken as the answer. Connections without
+        an input buffer can keep this default no-op.
+        """
+        pass
+    
     def __enter__(self):
         """Enable use with context manager"""
         self.open()
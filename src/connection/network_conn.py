@@ -183,16 +183,19 @@ class NetworkConnection(ConnectionBase):
         try:
             # Receive until terminator or max size
             buffer = bytearray()
-            start_time = time.time()
             timeout_value = timeout or self._timeout
+            deadline = time.monotonic() + timeout_value if timeout_value is not None else None
             
             while len(buffer) < max_size:
                 # Check for timeout
-                if timeout_value is not None and time.time() - start_time > timeout_value:
-                    raise TimeoutError("Terminator not received within timeout period")
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("Terminator not received within timeout period")
                 
-                # Check if data is available for reading
-                ready, _, _ = select.select([self._socket], [], [], 0.1)
+                # Block until data is available or the deadline passes
+                ready, _, _ = select.select([self._socket], [], [], remaining)
                 if not ready:
                     continue
                 
@@ -6,10 +6,15 @@ for serial connections (RS485/RS422) to PTZ cameras.
 """
 import serial
 import time
+import queue
+import select
+import logging
 import threading
 from typing import Optional, Dict, Any, Union, Callable, Tuple
 from .base import ConnectionBase
 
+logger = logging.getLogger(__name__)
+
 
 class SerialConnection(ConnectionBase):
     """
@@ -27,7 +32,8 @@ class SerialConnection(ConnectionBase):
                 parity: str = 'N',
                 timeout: float = 1.0,
                 polling_rate: float = None,
-                enable_polling: bool = True):
+                enable_polling: bool = True,
+                low_latency: bool = False):
         """
         Initialize serial connection.
         
@@ -38,6 +44,8 @@ class SerialConnection(ConnectionBase):
             stop_bits: Number of stop bits (1, 1.5, 2)
             parity: Parity checking ('N', 'E', 'O', 'M', 'S')
             timeout: Read timeout in seconds
+            low_latency: Ask the driver for low-latency mode (Linux
+                ASYNC_LOW_LATENCY, e.g. to drop the FTDI 16 ms latency timer)
         """
         self._port = port
         self._baudrate = baudrate
@@ -47,13 +55,22 @@ class SerialConnection(ConnectionBase):
         self._timeout = timeout
         self._polling_rate = polling_rate
         self._enable_polling = enable_polling
+        self._low_latency = low_latency
         
         # Serial connection object
         self._serial = None
         
-        # Lock to serialize all serial port I/O
+        # Lock to serialize all serial port reads
         self._io_lock = threading.Lock()
         
+        # Outbound frames are queued and written by a background thread so
+        # callers never block on the port
+        self._tx_queue = queue.Queue(maxsize=64)
+        self._tx_thread = None
+        
+        # First write error hit by the writer thread, raised by the next send()
+        self._tx_error = None
+        
         # Callback management
         self._callback = None
         self._callback_thread = None
@@ -66,11 +83,10 @@ class SerialConnection(ConnectionBase):
         Returns:
             True if successfully opened, False otherwise
         """
-        import time
-        
         # If there was a previous connection, ensure it's fully closed
         if self._serial is not None:
             try:
+                self._stop_writer()
                 self._serial.close()
                 self._serial = None
                 # Give the OS time to fully release the port
@@ -128,6 +144,9 @@ class SerialConnection(ConnectionBase):
                 # Validate connection is actually open
                 if self._serial.is_open:
                     print(f"Successfully opened serial port {self._port} on attempt {attempt}")
+                    if self._low_latency:
+                        self._enable_low_latency()
+                    self._start_writer()
                     return True
                 else:
                     print(f"Serial port {self._port} not open after creation on attempt {attempt}")
@@ -158,6 +177,14 @@ class SerialConnection(ConnectionBase):
         print(f"Failed to open serial port {self._port} after {max_retries} attempts")
         return False
     
+    def _enable_low_latency(self):
+        """Enable driver low-latency mode where the platform supports it"""
+        try:
+            self._serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            # Only available on Linux, and not every driver accepts the flag
+            logger.warning("Low-latency mode not available on %s: %s", self._port, e)
+    
     def close(self) -> bool:
         """
         Close the serial connection.
@@ -171,6 +198,9 @@ class SerialConnection(ConnectionBase):
                 if self._callback_active:
                     self.unregister_receive_callback()
                 
+                # Let queued frames go out before the port closes
+                self._stop_writer()
+                
                 # Close the connection
                 self._serial.close()
                 self._serial = None
@@ -192,24 +222,104 @@ class SerialConnection(ConnectionBase):
         """
         Send data over the serial connection.
         
+        The data is queued and written by a background thread in the order
+        it was sent; frames that queue up are coalesced into one write.
+        Because of this, a failed write is reported by the next call to
+        send() rather than by the one that queued the frame.
+        
         Args:
             data: Bytes to send
             
         Returns:
-            Number of bytes sent
+            Number of bytes queued for sending
             
         Raises:
             ConnectionError: If connection is not open
+            SerialException: If the writer thread failed to write an earlier frame
         """
         if not self.is_open():
             raise ConnectionError("Serial connection is not open")
         
+        # Surface a write error from the writer thread to the caller
+        error = self._tx_error
+        if error is not None:
+            self._tx_error = None
+            raise error
+        
+        # Frame dumps are only formatted when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SERIAL TX] >>> %s|Len: %d bytes", ' '.join(f'{b:02X}' for b in data), len(data))
+            logger.debug("[SERIAL TX] Command breakdown: %s", self._parse_pelco_command(data))
+        
+        # Hand the frame to the writer thread; blocks only if the queue is full
+        self._tx_queue.put(data)
+        return len(data)
+    
+    def discard_input(self) -> None:
+        """Drop unread bytes from the port's input buffer"""
+        if not self.is_open():
+            return
         with self._io_lock:
-            # Enhanced debug print for sent data
-            print(f"[SERIAL TX] >>> {' '.join(f'{b:02X}' for b in data)}|Len: {len(data)} bytes")
-            print(f"[SERIAL TX] Command breakdown: {self._parse_pelco_command(data)}")
+            self._serial.reset_input_buffer()
+    
+    def _start_writer(self):
+        """Start the background thread that writes queued frames"""
+        # Each writer gets its own queue and port object, so a previous writer
+        # still stuck in a slow write can never interleave with this one
+        self._tx_queue = queue.Queue(maxsize=64)
+        self._tx_error = None
+        self._tx_thread = threading.Thread(
+            target=self._writer_loop, args=(self._tx_queue, self._serial), daemon=True
+        )
+        self._tx_thread.start()
+    
+    def _stop_writer(self):
+        """Flush queued frames and stop the writer thread"""
+        if self._tx_thread is None:
+            return
+        try:
+            # A full queue means the writer is stuck; don't block behind it
+            self._tx_queue.put(None, timeout=2.0)
+            self._tx_thread.join(timeout=2.0)
+        except queue.Full:
+            pass
+        if self._tx_thread.is_alive():
+            # It exits once the pending write returns or fails on the closed port
+            logger.warning("[SERIAL TX] Writer thread still busy after 2s, abandoning it")
+        self._tx_thread = None
+    
+    def _writer_loop(self, tx_queue, port):
+        """Background thread that writes queued frames to the port"""
+        while True:
+            data = tx_queue.get()
+            if data is None:
+                break
+            
+            # Coalesce frames that queued up meanwhile into a single write
+            frames = [data]
+            stopping = False
+            while True:
+                try:
+                    data = tx_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if data is None:
+                    stopping = True
+                    break
+                frames.append(data)
+            
+            try:
+                port.write(b''.join(frames))
+            except Exception as e:
+                logger.warning("[SERIAL TX] Error writing to serial port: %s", e)
+                if self._tx_error is None and tx_queue is self._tx_queue:
+                    self._tx_error = e
+                if not port.is_open:
+                    # Abandoned by _stop_writer without a stop marker
+                    break
             
-            return self._serial.write(data)
+            if stopping:
+                break
     
     def _format_as_ascii(self, data: bytes) -> str:
         """Format bytes as ASCII, showing printable characters and hex for others"""
@@ -382,27 +492,23 @@ class SerialConnection(ConnectionBase):
                 # Always read exactly 5 bytes for position responses
                 data = self._serial.read(5)
                 
-                # Debug prints for received data
+                # Frame dumps are only formatted when debug logging is enabled
                 if data:
-                    print(f"[SERIAL RX] <<< {' '.join(f'{b:02X}' for b in data)} | Len: {len(data)} bytes")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[SERIAL RX] <<< %s | Len: %d bytes", ' '.join(f'{b:02X}' for b in data), len(data))
                     
                     # Parse as position response if we have full 5 bytes
                     if len(data) == 5 and (data[1] == 0x59 or data[1] == 0x5B):
-                        response_info = self._parse_pelco_response(data)
-                        print(f"[SERIAL RX] Response analysis: {response_info}")
-                        
-                        # Check if there's a checksum mismatch
-                        if "✗" in response_info:  # Symbol used to indicate checksum failure
-                            print(f"[SERIAL RX] Bad checksum detected, flushing input buffer")
-                            self._serial.reset_input_buffer()  # Immediate flush on bad checksum
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("[SERIAL RX] Response analysis: %s", self._parse_pelco_response(data))
                     elif len(data) == 5:
-                        print(f"[SERIAL RX] Invalid response format, flushing input buffer")
+                        logger.warning("[SERIAL RX] Invalid response format, flushing input buffer")
                         self._serial.reset_input_buffer()
                     elif len(data) < 5:
-                        print(f"[SERIAL RX] Incomplete response ({len(data)}/5 bytes), flushing input buffer")
+                        logger.warning("[SERIAL RX] Incomplete response (%d/5 bytes), flushing input buffer", len(data))
                         self._serial.reset_input_buffer()
                 elif timeout is not None:
-                    print(f"[SERIAL RX] No data received within timeout period ({timeout}s)")
+                    logger.warning("[SERIAL RX] No data received within timeout period (%ss)", timeout)
                     raise TimeoutError("No data received within timeout period")
                 
                 # Restore original timeout if changed
@@ -414,7 +520,7 @@ class SerialConnection(ConnectionBase):
             # Re-raise timeout error
             raise
         except Exception as e:
-            print(f"[SERIAL RX] Unexpected error in receive: {e}")
+            logger.warning("[SERIAL RX] Unexpected error in receive: %s", e)
             return bytes()
         finally:
             # Ensure timeout is restored even if an exception occurred inside the lock
@@ -423,7 +529,7 @@ class SerialConnection(ConnectionBase):
                     with self._io_lock:
                         self._serial.timeout = original_timeout
             except Exception as e:
-                print(f"[SERIAL RX] Error restoring timeout: {e}")
+                logger.warning("[SERIAL RX] Error restoring timeout: %s", e)
                 
     def _parse_pelco_response(self, data: bytes) -> str:
         """
@@ -525,7 +631,8 @@ class SerialConnection(ConnectionBase):
             'parity': self._parity,
             'timeout': self._timeout,
             'polling_rate': self._polling_rate,
-            'enable_polling': self._enable_polling
+            'enable_polling': self._enable_polling,
+            'low_latency': self._low_latency
         }
     
     def set_config(self, config: Dict[str, Any]) -> bool:
@@ -556,6 +663,7 @@ class SerialConnection(ConnectionBase):
             self._timeout = config.get('timeout', self._timeout)
             self._polling_rate = config.get('polling_rate', self._polling_rate)
             self._enable_polling = config.get('enable_polling', self._enable_polling)
+            self._low_latency = config.get('low_latency', self._low_latency)
             
             # Reopen connection if it was open
             if was_open:
@@ -581,8 +689,25 @@ class SerialConnection(ConnectionBase):
     
     def _callback_loop(self):
         """Background thread for receive callback"""
+        # Wait for input on the port's descriptor where there is one (POSIX);
+        # otherwise fall back to sleeping between buffer checks
+        try:
+            fd = self._serial.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        # Bounded so unregister_receive_callback() is noticed promptly
+        wait_timeout = 0.1
+        sleep_time = self._polling_rate if self._polling_rate is not None else 0.01
+        
         while self._callback_active and self._serial and self._serial.is_open:
             try:
+                # Wait outside the lock so receive() and the position queries
+                # are never held up by an idle port
+                if fd is not None:
+                    select.select([fd], [], [], wait_timeout)
+                else:
+                    time.sleep(sleep_time)
+                
                 data = None
                 with self._io_lock:
                     if self._serial.in_waiting:
@@ -590,10 +715,6 @@ class SerialConnection(ConnectionBase):
                 
                 if data and self._callback:
                     self._callback(data)
-                    
-                # Use configured polling rate or fallback to 0.01 if None
-                sleep_time = self._polling_rate if self._polling_rate is not None else 0.01
-                time.sleep(sleep_time)
             except Exception as e:
                 print(f"Error in serial callback loop: {e}")
                 break
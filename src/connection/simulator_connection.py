@@ -138,14 +138,25 @@ class SimulatorConnection:
         if not self._is_open:
             raise ConnectionError("Simulator connection is not open")
         
-        # Log the sent data
-        logger.info(f"TX: {' '.join(f'{b:02X}' for b in data)}")
+        # Frame dumps are only formatted when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TX: %s", ' '.join(f'{b:02X}' for b in data))
         
-        # Put data in TX buffer
-        self._tx_buffer.put(data)
+        # Put data in TX buffer one Pelco D frame at a time, as a device on
+        # a serial line would see back-to-back frames
+        for offset in range(0, len(data), 7):
+            self._tx_buffer.put(data[offset:offset + 7])
         
         return len(data)
     
+    def discard_input(self) -> None:
+        """Drop responses that have not been received yet"""
+        while True:
+            try:
+                self._rx_buffer.get_nowait()
+            except queue.Empty:
+                break
+    
     def receive(self, size: int = 1024, timeout: float = 1.0) -> bytes:
         """
         Receive data from the simulated device.
@@ -165,28 +176,21 @@ class SimulatorConnection:
             raise ConnectionError("Simulator connection is not open")
         
         try:
-            # Wait for data with timeout
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                try:
-                    # Check if there's data in the RX buffer
-                    data = self._rx_buffer.get(block=True, timeout=0.1)
-                    
-                    # Log the received data
-                    logger.info(f"RX: {' '.join(f'{b:02X}' for b in data)}")
-                    
-                    return data
-                except queue.Empty:
-                    # No data yet, continue waiting
-                    pass
+            # Block until a response is queued or the timeout expires
+            try:
+                data = self._rx_buffer.get(block=True, timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError("No data received within timeout period")
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RX: %s", ' '.join(f'{b:02X}' for b in data))
             
-            # Timeout occurred
-            raise TimeoutError("No data received within timeout period")
+            return data
         except TimeoutError:
             # Re-raise timeout errors
             raise
         except Exception as e:
-            logger.error(f"Error receiving data: {e}")
+            logger.error("Error receiving data: %s", e)
             return b''
     
     def receive_until(self, terminator: bytes, max_size: int = 1024, timeout: float = 1.0) -> bytes:
@@ -277,7 +281,7 @@ class SimulatorConnection:
                         elif cmd1 == 0x00 and cmd2 == 0x4B:
                             position = (data1 << 8) | data2
                             angle = position / 100.0
-                            logger.info(f"Command: Absolute Pan Position {angle:.2f}°")
+                            logger.info("Command: Absolute Pan Position %.2f°", angle)
                             
                             # Set pan angle
                             self.device_state.set_pan_angle(angle)
@@ -292,26 +296,26 @@ class SimulatorConnection:
                             else:
                                 angle = (36000 - position) / 100.0
                                 
-                            logger.info(f"Command: Absolute Tilt Position {angle:.2f}°")
+                            logger.info("Command: Absolute Tilt Position %.2f°", angle)
                             
                             # Set tilt angle
                             self.device_state.set_tilt_angle(angle)
                         
                         # Pan/tilt movement commands
                         elif cmd1 == 0x00 and cmd2 == 0x02:  # Right
-                            logger.info(f"Command: Pan Right (Speed: {data1})")
+                            logger.info("Command: Pan Right (Speed: %d)", data1)
                             # Handle movement simulation here if needed
                         
                         elif cmd1 == 0x00 and cmd2 == 0x04:  # Left
-                            logger.info(f"Command: Pan Left (Speed: {data1})")
+                            logger.info("Command: Pan Left (Speed: %d)", data1)
                             # Handle movement simulation here if needed
                         
                         elif cmd1 == 0x00 and cmd2 == 0x08:  # Up
-                            logger.info(f"Command: Tilt Up (Speed: {data2})")
+                            logger.info("Command: Tilt Up (Speed: %d)", data2)
                             # Handle movement simulation here if needed
                         
                         elif cmd1 == 0x00 and cmd2 == 0x10:  # Down
-                            logger.info(f"Command: Tilt Down (Speed: {data2})")
+                            logger.info("Command: Tilt Down (Speed: %d)", data2)
                             # Handle movement simulation here if needed
                         
                         # Zero point commands
@@ -325,13 +329,13 @@ class SimulatorConnection:
                         
                         # Other commands
                         else:
-                            logger.info(f"Unhandled command: {' '.join(f'{b:02X}' for b in command)}")
+                            logger.info("Unhandled command: %s", ' '.join(f'{b:02X}' for b in command))
                     
                 else:
-                    logger.warning(f"Invalid command format: {' '.join(f'{b:02X}' for b in command)}")
+                    logger.warning("Invalid command format: %s", ' '.join(f'{b:02X}' for b in command))
             
             except Exception as e:
-                logger.error(f"Error processing command: {e}")
+                logger.error("Error processing command: %s", e)
     
     @property
     def config(self) -> Dict[str, Any]:
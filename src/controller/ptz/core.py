@@ -9,6 +9,7 @@ Public import path stays:
 """
 from __future__ import annotations
 import logging
+import threading
 from typing import Dict, Any, Tuple
 
 from src.connection import ConnectionBase, SerialConnection
@@ -25,6 +26,13 @@ class PTZController:
         self._initialized = False
         self._zero_pan_angle = 0.0
         self._zero_tilt_angle = 0.0
+        # Send pan and tilt queries back-to-back; disable for devices that
+        # only answer one outstanding query at a time
+        self._pipeline_queries = connection_config.get("pipeline_queries", True)
+        # Serializes each discard/send/receive query sequence; the position
+        # thread, the API routes and the command worker all query. Reentrant
+        # so a combined query can fall back to the per-axis ones
+        self._query_lock = threading.RLock()
 
         # --- tiny shims so we work with either protocol API name -----
         self._build_pan_query = (
@@ -35,16 +43,16 @@ class PTZController:
             getattr(self.protocol, "tilt_position_query", None)
             or getattr(self.protocol, "query_tilt_position")
         )
+        # The query frames only depend on the address, so build them once
+        self._pan_query = self._build_pan_query()
+        self._tilt_query = self._build_tilt_query()
 
         # --------------------------------------------------------------
-        if not self.connection.open():
+        if not self.connection.is_open() and not self.connection.open():
             raise ConnectionError("Failed to open serial connection")
 
-        # flush any pending bytes; ignore timeout
-        try:
-            self.connection.receive(size=64, timeout=0.1)
-        except Exception:
-            pass
+        # flush any pending bytes without waiting on a read timeout
+        self.connection.discard_input()
     # --------------------------------------------------------- private utils
     def _create_connection(self, cfg: Dict[str, Any]) -> ConnectionBase:
         port = cfg.get("port", "COM3")
@@ -66,13 +74,13 @@ class PTZController:
                 parity=cfg.get("parity", "N"),
                 polling_rate=cfg.get("polling_rate"),
                 enable_polling=cfg.get("enable_polling", True),
+                low_latency=cfg.get("low_latency", False),
             )
             
             # Test if we can actually open the port
             if serial_conn.open():
                 log.info(f"Successfully opened serial connection on {port}")
-                serial_conn.close()  # Close it so __init__ can open it cleanly
-                return serial_conn
+                return serial_conn  # Left open; __init__ reuses it
             else:
                 log.warning(f"Failed to open serial connection on {port}")
         except Exception as e:
@@ -81,6 +89,10 @@ class PTZController:
     def _send_command(self, frame: bytes) -> None:
         self.connection.send(frame)
 
+    def _send_commands(self, *frames: bytes) -> None:
+        """Send several frames back-to-back in a single write."""
+        self.connection.send(b"".join(frames))
+
     # ------------------------------------------------------------- RX logic
 
 
@@ -94,20 +106,22 @@ class PTZController:
             The angle in degrees.
 
         Notes:
-            On any error or malformed response, this will print a warning
+            On any error or malformed response, this will log a warning
             and return 0.0 instead of raising.
         """
         try:
-            frame = self._build_pan_query()
-            self._send_command(frame)
-            raw_response = self.connection.receive(timeout=2.0)  # Direct use of receive
+            frame = self._pan_query
+            with self._query_lock:
+                self.connection.discard_input()  # Drop stale replies
+                self._send_command(frame)
+                raw_response = self.connection.receive(timeout=2.0)  # Direct use of receive
             result = self.protocol.parse_response(raw_response)
             if not result or result.get('type') != 'pan_position' or not result.get('valid'):
-                print(f"WARNING: Invalid pan position response: {raw_response.hex()}")
+                log.warning("Invalid pan position response: %s", raw_response.hex())
                 return 0.0
             return result['angle']
         except Exception as e:
-            print(f"WARNING: Error querying pan position: {e}")
+            log.warning("Error querying pan position: %s", e)
             return 0.0
 
     def query_tilt_position(self) -> float:
@@ -118,22 +132,62 @@ class PTZController:
             The angle in degrees.
 
         Notes:
-            On any error or malformed response, this will print a warning
+            On any error or malformed response, this will log a warning
             and return 0.0 instead of raising.
         """
         try:
-            frame = self._build_tilt_query()
-            self._send_command(frame)
-            raw_response = self.connection.receive(timeout=2.0)  # Direct use of receive
+            frame = self._tilt_query
+            with self._query_lock:
+                self.connection.discard_input()  # Drop stale replies
+                self._send_command(frame)
+                raw_response = self.connection.receive(timeout=2.0)  # Direct use of receive
             result = self.protocol.parse_response(raw_response)
             if not result or result.get('type') != 'tilt_position' or not result.get('valid'):
-                print(f"WARNING: Invalid tilt position response: {raw_response.hex()}")
+                log.warning("Invalid tilt position response: %s", raw_response.hex())
                 return 0.0
             return result['angle']
         except Exception as e:
-            print(f"WARNING: Error querying tilt position: {e}")
+            log.warning("Error querying tilt position: %s", e)
             return 0.0
 
+    def _query_positions(self) -> Tuple[float, float]:
+        """
+        Query pan and tilt positions together.
+
+        Both query frames go out in a single write and the two responses
+        are matched by their type, so the tilt request is already on the
+        wire while the pan response is in transit.
+
+        Returns:
+            Tuple of (pan_angle, tilt_angle) in degrees; 0.0 for any axis
+            whose response was missing or malformed.
+        """
+        if not self._pipeline_queries:
+            return self.query_pan_position(), self.query_tilt_position()
+
+        angles = {}
+        with self._query_lock:
+            try:
+                self.connection.discard_input()  # Drop stale replies
+                self._send_commands(self._pan_query, self._tilt_query)
+                for _ in range(2):
+                    raw_response = self.connection.receive(timeout=2.0)
+                    result = self.protocol.parse_response(raw_response)
+                    if not result or result.get('type') not in ('pan_position', 'tilt_position') or not result.get('valid'):
+                        log.warning("Invalid position response: %s", raw_response.hex())
+                        # The connection flushes its input after a malformed
+                        # reply, so the other one may be gone; query the
+                        # missing axes one at a time instead of waiting
+                        if 'pan_position' not in angles:
+                            angles['pan_position'] = self.query_pan_position()
+                        if 'tilt_position' not in angles:
+                            angles['tilt_position'] = self.query_tilt_position()
+                        break
+                    angles[result['type']] = result['angle']
+            except Exception as e:
+                log.warning("Error querying position: %s", e)
+        return angles.get('pan_position', 0.0), angles.get('tilt_position', 0.0)
+
     def get_relative_position(self) -> Tuple[float, float, dict]:
         """
         Get the current pan and tilt position relative to the stored zero points.
@@ -150,8 +204,7 @@ class PTZController:
             }
         """
         # 1) Query absolute angles
-        pan_angle = self.query_pan_position()
-        tilt_angle = self.query_tilt_position()
+        pan_angle, tilt_angle = self._query_positions()
 
         # 2) Only apply offset correction if initialized
         if self._initialized:
@@ -185,18 +238,18 @@ class PTZController:
         """
 
         try:
-            log.info("Zeroing pan…")
-            self._send_command(self.protocol.set_pan_zero_point())
-            time.sleep(0.2)
-            log.info("Zeroing tilt…")
-            self._send_command(self.protocol.set_tilt_zero_point())
-            time.sleep(0.2)
+            log.info("Zeroing pan and tilt…")
+            self._send_commands(
+                self.protocol.set_pan_zero_point(),
+                self.protocol.set_tilt_zero_point(),
+            )
+            # Same total settling time the device previously got between frames
+            time.sleep(0.4)
         except Exception as e:
             log.warning(f"Error sending zero‐point commands: {e}")
 
 
-        pan_ang = self.query_pan_position()
-        tilt_ang = self.query_tilt_position()
+        pan_ang, tilt_ang = self._query_positions()
 
         self._zero_pan_angle = pan_ang
         self._zero_tilt_angle = tilt_ang
@@ -270,6 +323,22 @@ class PTZController:
         command = self.protocol.absolute_tilt(angle)
         self._send_command(command)
 
+    def absolute_pan_tilt(self, pan_angle=None, tilt_angle=None):
+        """
+        Move both axes to an absolute position with a single write.
+
+        Args:
+            pan_angle: Pan angle in degrees (0-360), or None to leave pan as is
+            tilt_angle: Tilt angle in degrees (-90 to +90), or None to leave tilt as is
+        """
+        frames = []
+        if pan_angle is not None:
+            frames.append(self.protocol.absolute_pan(pan_angle))
+        if tilt_angle is not None:
+            frames.append(self.protocol.absolute_tilt(tilt_angle))
+        if frames:
+            self._send_commands(*frames)
+
     def query_position(self):
         """
         Query the current absolute position.
@@ -279,9 +348,7 @@ class PTZController:
         Returns:
             Tuple of (pan_angle, tilt_angle) in degrees
         """
-        pan_angle = self.query_pan_position()
-        tilt_angle = self.query_tilt_position()
-        return (pan_angle, tilt_angle)
+        return self._query_positions()
 
     # Basic implementations for other methods referenced in the API routes
     def set_preset(self, preset_id):
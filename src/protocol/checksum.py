@@ -1,6 +1,7 @@
 """
 Utilities for calculating and validating checksums for Pelco D protocol.
 """
+from itertools import islice
 from typing import List, Union, Iterable
 
 
@@ -17,8 +18,9 @@ def calculate_checksum(message: Iterable[int]) -> int:
     Returns:
         Calculated checksum as an integer
     """
-    # Skip sync byte (first byte) for checksum calculation
-    checksum = sum(list(message)[1:]) & 0xFF
+    # Skip sync byte (first byte) for checksum calculation; islice avoids
+    # copying the message into a list first
+    checksum = sum(islice(message, 1, None)) & 0xFF
     return checksum
 
 
@@ -33,10 +35,17 @@ def validate_checksum(message: Iterable[int]) -> bool:
         True if checksum is valid, False otherwise
     """
     # Extract message without checksum and the provided checksum
-    message_bytes = list(message)
+    if isinstance(message, (bytes, bytearray)):
+        message_bytes = message
+    else:
+        try:
+            message_bytes = bytes(message)
+        except (TypeError, ValueError):
+            # Values outside 0-255 can never form a valid message
+            return False
     provided_checksum = message_bytes[-1]
     
-    # Calculate expected checksum
-    expected_checksum = calculate_checksum(message_bytes[:-1])
+    # Calculate expected checksum over the bytes between sync and checksum
+    expected_checksum = sum(message_bytes[1:-1]) & 0xFF
     
     return provided_checksum == expected_checksum
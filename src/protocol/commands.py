@@ -4,8 +4,11 @@ Command builders for Pelco D protocol.
 This module provides functions to generate Pelco D protocol command packets
 for various camera operations.
 """
+import struct
 from typing import List, Tuple, Optional
-from .checksum import calculate_checksum
+
+# Frame layout: sync, address, cmd1, cmd2, data1, data2, checksum
+FRAME = struct.Struct('7B')
 
 
 def create_basic_command(address: int, cmd1: int, cmd2: int, data1: int, data2: int) -> bytes:
@@ -22,14 +25,10 @@ def create_basic_command(address: int, cmd1: int, cmd2: int, data1: int, data2:
     Returns:
         Command bytes
     """
-    # Create message without checksum
-    message = [0xFF, address, cmd1, cmd2, data1, data2]
-    
-    # Calculate and append checksum
-    checksum = calculate_checksum(message)
-    message.append(checksum)
+    # Checksum is the sum of all bytes except the sync byte, modulo 256
+    checksum = (address + cmd1 + cmd2 + data1 + data2) & 0xFF
     
-    return bytes(message)
+    return FRAME.pack(0xFF, address, cmd1, cmd2, data1, data2, checksum)
 
 
 # Movement commands
@@ -8,8 +8,10 @@ from typing import List, Tuple, Optional, Union, Dict, Any
 import time
 import threading
 import logging
-from .checksum import calculate_checksum, validate_checksum
+import struct
+from .checksum import validate_checksum
 from .commands import (
+    FRAME,
     create_stop_command,
     create_up_command,
     create_down_command,
@@ -41,6 +43,9 @@ from .commands import (
 
 logger = logging.getLogger(__name__)
 
+# Big-endian 16-bit position value inside a response
+_U16 = struct.Struct('>H').unpack_from
+
 class PelcoDProtocol:
     """
     Implementation of the Pelco D protocol for pan-tilt unit control.
@@ -62,6 +67,22 @@ class PelcoDProtocol:
     CMD_PAN_POSITION_RESPONSE = 0x59
     CMD_TILT_POSITION_RESPONSE = 0x5B
     
+    # Builders for commands that only depend on the address
+    _CONSTANT_COMMANDS = {
+        'stop': create_stop_command,
+        'query_pan_position': create_pan_position_query,
+        'query_tilt_position': create_tilt_position_query,
+        'set_pan_zero_point': create_set_pan_zero_point_command,
+        'set_tilt_zero_point': create_set_tilt_zero_point_command,
+        'remote_reset': create_remote_reset_command,
+        'zoom_in': create_zoom_in_command,
+        'zoom_out': create_zoom_out_command,
+        'focus_far': create_focus_far_command,
+        'focus_near': create_focus_near_command,
+        'iris_open': create_iris_open_command,
+        'iris_close': create_iris_close_command,
+    }
+    
     def __init__(self, address: int = 1):
         """
         Initialize the PelcoD protocol handler.
@@ -73,6 +94,11 @@ class PelcoDProtocol:
             raise ValueError(f"Address must be between 1 and 255, got {address}")
         
         self.address = address
+        
+        # Parameterless commands are fixed once the address is known
+        self._const_cmds = {
+            name: builder(address) for name, builder in self._CONSTANT_COMMANDS.items()
+        }
     
     def create_message(self, cmd1: int, cmd2: int, data1: int, data2: int) -> bytes:
         """
@@ -87,17 +113,11 @@ class PelcoDProtocol:
         Returns:
             Bytes object containing the complete Pelco D message
         """
-        # Create message without checksum
-        message = [self.SYNC_BYTE, self.address, cmd1, cmd2, data1, data2]
-        
-        # Calculate checksum
-        checksum = calculate_checksum(message)
-        
-        # Add checksum to message
-        message.append(checksum)
-        
-        # Convert to bytes
-        return bytes(message)
+        # The address is fixed, so the frame is packed directly instead of
+        # going through create_basic_command
+        address = self.address
+        checksum = (address + cmd1 + cmd2 + data1 + data2) & 0xFF
+        return FRAME.pack(self.SYNC_BYTE, address, cmd1, cmd2, data1, data2, checksum)
 
     def parse_response(self, data: bytes) -> Optional[Dict[str, Any]]:
         """
@@ -120,12 +140,12 @@ class PelcoDProtocol:
                 logger.warning("Empty response data received")
                 return None
                 
-            hex_data = ' '.join(f'{b:02X}' for b in data)
-            logger.debug(f"Parsing response: {hex_data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsing response: %s", ' '.join(f'{b:02X}' for b in data))
 
             # Verify expected 5-byte length
             if len(data) != 5:
-                logger.warning(f"Unexpected message length: {len(data)}, expected 5 bytes")
+                logger.warning("Unexpected message length: %d, expected 5 bytes", len(data))
                 return None
                 
             # BIT-CCTV 5-byte format parsing
@@ -142,61 +162,56 @@ class PelcoDProtocol:
                 checksum_valid = (calculated_checksum == checksum or calculated_checksum + 1 == checksum)
                 
                 if not checksum_valid:
-                    logger.warning(f"Checksum mismatch in 5-byte format: calculated 0x{calculated_checksum:02X}, got 0x{checksum:02X}")
+                    logger.warning("Checksum mismatch in 5-byte format: calculated 0x%02X, got 0x%02X",
+                                   calculated_checksum, checksum)
                     # Continue processing despite checksum mismatch
                 
+                # Both position responses carry a big-endian value in
+                # hundredths of a degree; only the angle mapping differs
+                raw_value = _U16(data, 2)[0]
+                
                 # Pan position response
                 if cmd_byte == self.CMD_PAN_POSITION_RESPONSE:
-                    raw_value = (data1 << 8) | data2
-                    pan_angle_0_360 = (raw_value / 100.0) % 360.0
-                    
-                    # Convert to -180 to 180 range
-                    pan_angle = pan_angle_0_360
-                    if pan_angle > 180.0:
-                        pan_angle -= 360.0
-                    
-                    logger.debug(f"Pan position: raw=0x{data1:02X}{data2:02X}={raw_value}, angle={pan_angle:.2f}°")
-                    return {
-                        'type': 'pan_position',
-                        'angle': pan_angle,
-                        'raw': raw_value,
-                        'valid': True
-                    }
+                    response_type = 'pan_position'
+                    # Convert 0-360 to -180 to 180 range
+                    angle = (raw_value / 100.0) % 360.0
+                    if angle > 180.0:
+                        angle -= 360.0
                     
                 # Tilt position response
                 elif cmd_byte == self.CMD_TILT_POSITION_RESPONSE:
-                    raw_value = (data1 << 8) | data2
+                    response_type = 'tilt_position'
                     # Calculate tilt angle using Pelco D formula
                     if raw_value > 18000:
-                        tilt_angle = ((36000 - raw_value) / 100.0)  # Positive angle
+                        angle = ((36000 - raw_value) / 100.0)  # Positive angle
                     else:
-                        tilt_angle = -(raw_value / 100.0)  # Negative angle
-                        
-                    logger.debug(f"Tilt position: raw=0x{data1:02X}{data2:02X}={raw_value}, angle={tilt_angle:.2f}°")
-                    return {
-                        'type': 'tilt_position',
-                        'angle': tilt_angle,
-                        'raw': raw_value,
-                        'valid': True
-                    }
+                        angle = -(raw_value / 100.0)  # Negative angle
                     
                 else:
-                    logger.warning(f"Unknown command byte: 0x{cmd_byte:02X}")
+                    logger.warning("Unknown command byte: 0x%02X", cmd_byte)
                     return None
+                
+                logger.debug("%s: raw=0x%04X=%d, angle=%.2f°", response_type, raw_value, raw_value, angle)
+                return {
+                    'type': response_type,
+                    'angle': angle,
+                    'raw': raw_value,
+                    'valid': True
+                }
                     
             except IndexError as e:
-                logger.warning(f"Index error while parsing response: {e}, data: {hex_data}")
+                logger.warning("Index error while parsing response: %s, data: %s", e, ' '.join(f'{b:02X}' for b in data))
                 return None
                 
         except Exception as e:
-            logger.warning(f"Unexpected error parsing response: {e}, data: {data.hex() if data else 'None'}")
+            logger.warning("Unexpected error parsing response: %s, data: %s", e, data.hex() if data else 'None')
             return None
 
     # Movement commands
     
     def stop(self) -> bytes:
         """Stop all movement."""
-        return create_stop_command(self.address)
+        return self._const_cmds['stop']
         
     def move_up(self, speed: int = 0x20) -> bytes:
         """Move up at specified speed."""
@@ -248,11 +263,11 @@ class PelcoDProtocol:
     
     def query_pan_position(self) -> bytes:
         """Generate command to query pan position."""
-        return create_pan_position_query(self.address)
+        return self._const_cmds['query_pan_position']
         
     def query_tilt_position(self) -> bytes:
         """Generate command to query tilt position."""
-        return create_tilt_position_query(self.address)
+        return self._const_cmds['query_tilt_position']
     
     # Absolute position commands
     
@@ -278,40 +293,40 @@ class PelcoDProtocol:
     
     def set_pan_zero_point(self) -> bytes:
         """Set current pan position as zero point."""
-        return create_set_pan_zero_point_command(self.address)
+        return self._const_cmds['set_pan_zero_point']
         
     def set_tilt_zero_point(self) -> bytes:
         """Set current tilt position as zero point."""
-        return create_set_tilt_zero_point_command(self.address)
+        return self._const_cmds['set_tilt_zero_point']
     
     # Reset command
     
     def remote_reset(self) -> bytes:
         """Reset the device."""
-        return create_remote_reset_command(self.address)
+        return self._const_cmds['remote_reset']
     
     # Optical commands
     
     def zoom_in(self) -> bytes:
         """Zoom in."""
-        return create_zoom_in_command(self.address)
+        return self._const_cmds['zoom_in']
         
     def zoom_out(self) -> bytes:
         """Zoom out."""
-        return create_zoom_out_command(self.address)
+        return self._const_cmds['zoom_out']
         
     def focus_far(self) -> bytes:
         """Focus far."""
-        return create_focus_far_command(self.address)
+        return self._const_cmds['focus_far']
         
     def focus_near(self) -> bytes:
         """Focus near."""
-        return create_focus_near_command(self.address)
+        return self._const_cmds['focus_near']
         
     def iris_open(self) -> bytes:
         """Open iris."""
-        return create_iris_open_command(self.address)
+        return self._const_cmds['iris_open']
         
     def iris_close(self) -> bytes:
         """Close iris."""
-        return create_iris_close_command(self.address)
+        return self._const_cmds['iris_close']
@@ -2,10 +2,23 @@
 Utilities for loading and managing configuration.
 """
 import os
-import yaml
+import copy
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 
+@lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; cached per path and modification time"""
+    # Imported here so that importing src.utils does not pull in PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=loader)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
@@ -39,10 +52,11 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         if config_path is None:
             raise FileNotFoundError(f"Configuration file not found in {possible_paths}")
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    # Repeat loads of an unchanged file are served from the cache; callers
+    # get their own copy so they can modify it freely
+    config = _parse_config(config_path, os.stat(config_path).st_mtime_ns)
     
-    return config
+    return copy.deepcopy(config)
 
 
 def get_connection_config(config: Dict[str, Any]) -> Dict[str, Any]: